@@ -1,47 +1,287 @@
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from math import gcd
 import librosa
-import librosa.display
-import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.ticker import MaxNLocator
 import numpy as np
+import soundfile as sf
+from scipy.signal import resample_poly
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import numba
+except ImportError:  # optional: only speeds up the amplitude histograms
+    numba = None
+
 
 DATASET_PATH = r"C:\Users\MZ\Downloads\Dataset"
 
+# Formats libsndfile decodes natively; anything else goes through librosa
+SOUNDFILE_EXTENSIONS = {'.wav', '.flac', '.ogg'}
+
+# Files longer than this are streamed block by block instead of decoded whole
+LONG_AUDIO_SECONDS = 30
+STREAM_BLOCKSIZE = 65536
+
+AUDIO_EXTENSIONS = {'wav', 'mp3', 'flac', 'm4a'}
+REAL_KEYWORDS = ('real', 'genuine', 'original', 'natural')
+FAKE_KEYWORDS = ('fake', 'synthetic', 'generated', 'artificial')
+
+
+def decode_audio(path):
+    """Decode an audio file to mono float32 at its native sample rate"""
+    path = Path(path)
+    if path.suffix.lower() in SOUNDFILE_EXTENSIONS:
+        audio, sr = sf.read(str(path), dtype='float32', always_2d=False)
+        if audio.ndim == 2:
+            audio = audio.mean(axis=1)
+        return audio, sr
+    audio, sr = librosa.load(path, sr=None)
+    return audio.astype(np.float32, copy=False), sr
+
+
+def is_long_audio(path):
+    """True for files that can be streamed and are too long to decode whole"""
+    path = Path(path)
+    if path.suffix.lower() not in SOUNDFILE_EXTENSIONS:
+        return False
+    info = sf.info(str(path))
+    return info.frames > LONG_AUDIO_SECONDS * info.samplerate
+
+
+def walk_audio_files(root):
+    """Yield audio file paths under root in a single directory walk"""
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Missing or unreadable directories are skipped, as rglob does
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.rpartition('.')[2].lower() in AUDIO_EXTENSIONS:
+                    yield entry.path
+
+
+def time_axis(n, sr):
+    """Build a float32 time axis in seconds for n samples"""
+    return np.arange(n, dtype=np.float32) * np.float32(1.0 / sr)
+
+
+def decimate_waveform(audio, time, target=8000):
+    """Reduce a waveform to a min/max envelope of at most 2 * target points"""
+    n = len(audio)
+    if n <= 2 * target:
+        return time[:n], audio
+    step = -(-n // target)
+    n_full = n // step
+    blocks = audio[:n_full * step].reshape(n_full, step)
+    mins, maxs = blocks.min(axis=1), blocks.max(axis=1)
+    if n_full * step < n:
+        # The trailing partial block keeps the envelope covering the whole signal
+        tail = audio[n_full * step:]
+        mins = np.append(mins, tail.min())
+        maxs = np.append(maxs, tail.max())
+    envelope = np.empty(2 * len(mins), dtype=audio.dtype)
+    envelope[0::2] = mins
+    envelope[1::2] = maxs
+    starts = np.arange(len(mins)) * step
+    envelope_time = np.empty(2 * len(mins), dtype=time.dtype)
+    envelope_time[0::2] = time[starts]
+    envelope_time[1::2] = time[np.minimum(starts + step // 2, n - 1)]
+    return envelope_time, envelope
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _histogram_counts(x, bins, lo, hi):
+        """Count samples per bin, one partial histogram per thread"""
+        n_chunks = numba.get_num_threads()
+        chunk = (x.size + n_chunks - 1) // n_chunks
+        partial = np.zeros((n_chunks, bins), np.int64)
+        inv = bins / (hi - lo)
+        for c in numba.prange(n_chunks):
+            for i in range(c * chunk, min((c + 1) * chunk, x.size)):
+                b = int((x[i] - lo) * inv)
+                if b == bins:
+                    b = bins - 1  # the top edge belongs to the last bin, as in np.histogram
+                if 0 <= b < bins:
+                    partial[c, b] += 1
+        return partial.sum(axis=0)
+else:
+    def _histogram_counts(x, bins, lo, hi):
+        """Count samples per bin with NumPy when Numba is not installed"""
+        return np.histogram(x, bins=bins, range=(lo, hi))[0]
+
+
+def histogram_range(lo, hi):
+    """Histogram range for the given extremes, widened like np.histogram for constant input"""
+    lo, hi = float(lo), float(hi)
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    return lo, hi
+
+
+def counts_to_density(counts, lo, hi):
+    """Normalize bin counts to a density over evenly spaced edges"""
+    edges = np.linspace(lo, hi, len(counts) + 1)
+    return counts / (counts.sum() * np.diff(edges)), edges
+
+
+def amplitude_density(audio, bins=50):
+    """Equivalent of np.histogram(audio, bins, density=True) using the parallel kernel"""
+    lo, hi = histogram_range(audio.min(), audio.max())
+    return counts_to_density(_histogram_counts(audio, bins, lo, hi), lo, hi)
+
+
+def limit_ticks(ax, nbins=5):
+    """Cap the tick count on a waveform axis to keep tick text cheap to draw"""
+    ax.xaxis.set_major_locator(MaxNLocator(nbins))
+    ax.yaxis.set_major_locator(MaxNLocator(nbins))
+    ax.tick_params(labelsize=9)
 
 
 class WaveformAnalyzer:
+    _REAL_RE = re.compile('|'.join(REAL_KEYWORDS), re.IGNORECASE)
+    _FAKE_RE = re.compile('|'.join(FAKE_KEYWORDS), re.IGNORECASE)
+
     def __init__(self, data_path):
         self.data_path = data_path
         self.real_files = []
         self.fake_files = []
+        self._audio_cache = {}
+
+    def _cache_audio(self, path, audio, sr):
+        """Store decoded samples together with their time axis"""
+        self._audio_cache[path] = (audio, sr, time_axis(len(audio), sr))
+        return self._audio_cache[path]
+
+    def _load(self, path):
+        """Load an audio file once and reuse the decoded samples"""
+        path = Path(path)
+        if path not in self._audio_cache:
+            return self._cache_audio(path, *decode_audio(path))
+        return self._audio_cache[path]
+
+    def _load_prefix(self, path, seconds):
+        """Load only the first `seconds` of an audio file, slicing the cache when it is already decoded"""
+        path = Path(path)
+        if path in self._audio_cache:
+            audio, sr, time = self._audio_cache[path]
+            max_samples = int(seconds * sr)
+            return audio[:max_samples], sr, time[:max_samples]
+        if path.suffix.lower() in SOUNDFILE_EXTENSIONS:
+            with sf.SoundFile(str(path)) as f:
+                sr = f.samplerate
+                audio = f.read(frames=int(seconds * sr), dtype='float32', always_2d=False)
+            if audio.ndim == 2:
+                audio = audio.mean(axis=1)
+        else:
+            audio, sr = librosa.load(path, sr=None, duration=seconds)
+            audio = audio.astype(np.float32, copy=False)
+        return audio, sr, time_axis(len(audio), sr)
+
+    def _load_decimated(self, path, target=8000):
+        """Build a min/max envelope, streaming long files instead of decoding them whole"""
+        path = Path(path)
+        if path in self._audio_cache or not is_long_audio(path):
+            audio, _, time = self._load(path)
+            return decimate_waveform(audio, time, target)
+
+        info = sf.info(str(path))
+        step = -(-info.frames // target)
+        n_blocks = -(-info.frames // step)
+        envelope = np.empty(2 * n_blocks, dtype=np.float32)
+        with sf.SoundFile(str(path)) as f:
+            # The last block is shorter when frames is not a multiple of step
+            for i, block in enumerate(f.blocks(blocksize=step, dtype='float32', always_2d=True)):
+                block = block.mean(axis=1)
+                envelope[2 * i] = block.min()
+                envelope[2 * i + 1] = block.max()
+        block_starts = np.arange(n_blocks) * step
+        envelope_time = np.empty(2 * n_blocks, dtype=np.float32)
+        envelope_time[0::2] = block_starts
+        envelope_time[1::2] = np.minimum(block_starts + step // 2, info.frames - 1)
+        return envelope_time / np.float32(info.samplerate), envelope
+
+    def _amplitude_density(self, path, bins=50):
+        """Amplitude histogram of a file, accumulated blockwise for long files"""
+        path = Path(path)
+        if path in self._audio_cache or not is_long_audio(path):
+            audio, _, _ = self._load(path)
+            return amplitude_density(audio, bins)
+
+        with sf.SoundFile(str(path)) as f:
+            lo, hi = np.inf, -np.inf
+            for block in f.blocks(blocksize=STREAM_BLOCKSIZE, dtype='float32', always_2d=True):
+                block = block.mean(axis=1)
+                lo, hi = min(lo, block.min()), max(hi, block.max())
+            lo, hi = histogram_range(lo, hi)
+
+            f.seek(0)
+            counts = np.zeros(bins, dtype=np.int64)
+            for block in f.blocks(blocksize=STREAM_BLOCKSIZE, dtype='float32', always_2d=True):
+                counts += _histogram_counts(block.mean(axis=1), bins, lo, hi)
+        return counts_to_density(counts, lo, hi)
+
+    def prefetch_audio(self):
+        """Decode the short example files in parallel before plotting
+
+        Plot A, the overlay and the histogram need every sample of a short file,
+        so it is decoded whole once here and the 5 s / 2 s prefix plots slice the
+        cached copy. Long files are skipped: the plots stream them instead.
+        """
+        examples = {Path(files[0]) for files in (self.real_files, self.fake_files) if files}
+        pending = []
+        for path in examples:
+            if path in self._audio_cache:
+                continue
+            try:
+                if not is_long_audio(path):
+                    pending.append(path)
+            except Exception as e:
+                print(f" Error decoding {path.name}: {e}")
+        if not pending:
+            return
+        # Threads rather than processes: libsndfile releases the GIL while decoding,
+        # and spawned workers would re-import librosa/scipy/matplotlib for two files
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {path: executor.submit(decode_audio, path) for path in pending}
+            for path, future in futures.items():
+                try:
+                    self._cache_audio(path, *future.result())
+                except Exception as e:
+                    print(f" Error decoding {path.name}: {e}")
 
     def find_audio_files(self):
         """Find and categorize audio files"""
         print(" Searching for audio files...")
 
-        audio_extensions = ['*.wav', '*.mp3', '*.flac', '*.m4a']
-
-        for ext in audio_extensions:
-            for file_path in Path(self.data_path).rglob(ext):
-                filename = file_path.name.lower()
-                file_path_str = str(file_path)
-
-                # Categorize based on filename or folder name
-                if any(keyword in filename or keyword in file_path_str.lower()
-                       for keyword in ['real', 'genuine', 'original', 'natural']):
+        for path_str in walk_audio_files(self.data_path):
+            file_path = Path(path_str)
+            # Categorize based on filename or folder name, checking the
+            # short filename first and the folder only on a miss
+            folder, filename = os.path.split(path_str)
+            if self._REAL_RE.search(filename) or self._REAL_RE.search(folder):
+                self.real_files.append(file_path)
+            elif self._FAKE_RE.search(filename) or self._FAKE_RE.search(folder):
+                self.fake_files.append(file_path)
+            else:
+                # If unknown, distribute evenly
+                if len(self.real_files) <= len(self.fake_files):
                     self.real_files.append(file_path)
-                elif any(keyword in filename or keyword in file_path_str.lower()
-                         for keyword in ['fake', 'synthetic', 'generated', 'artificial']):
-                    self.fake_files.append(file_path)
                 else:
-                    # If unknown, distribute evenly
-                    if len(self.real_files) <= len(self.fake_files):
-                        self.real_files.append(file_path)
-                    else:
-                        self.fake_files.append(file_path)
+                    self.fake_files.append(file_path)
 
         print(f" Found {len(self.real_files)} real audio files")
         print(f" Found {len(self.fake_files)} fake audio files")
@@ -51,89 +291,98 @@ class WaveformAnalyzer:
             return False
         return True
 
-    def create_waveform_comparison(self):
-        """Create waveform comparison plots"""
+    def create_waveform_comparison(self, fig=None, axes=None):
+        """Create waveform comparison plots, reusing fig/axes when given"""
         print(" Creating waveform analysis...")
 
         # Create output folder
         output_dir = Path(self.data_path) / "plots"
         output_dir.mkdir(exist_ok=True)
 
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-
-        # Select examples
-        real_example = self.real_files[0] if self.real_files else None
-        fake_example = self.fake_files[0] if self.fake_files else None
-
-        # --- PLOT 1: Combined Waveform ---
-        if real_example and fake_example:
-            try:
-                audio_real, sr_real = librosa.load(real_example, sr=None)
-                audio_fake, sr_fake = librosa.load(fake_example, sr=None)
-
-                time_real = np.arange(len(audio_real)) / sr_real
-                time_fake = np.arange(len(audio_fake)) / sr_fake
-
-                axes[0, 0].plot(time_real, audio_real, color='#2E8B57',
-                                label='Real Sound', linewidth=1.5, alpha=0.8)
-                axes[0, 0].plot(time_fake, audio_fake, color='#DC143C',
-                                label='Fake Sound', linewidth=1.5, alpha=0.7)
-                axes[0, 0].set_title("A) Real vs Fake Waveform", fontsize=14, fontweight='bold')
-                axes[0, 0].set_xlabel("Time (s)")
-                axes[0, 0].set_ylabel("Amplitude")
-                axes[0, 0].legend()
-                axes[0, 0].grid(alpha=0.3)
-            except Exception as e:
-                print(f" Error plotting combined waveform: {e}")
-
-        # --- PLOT 2: Real Waveform ---
-        if real_example:
-            try:
-                audio_real, sr_real = librosa.load(real_example, sr=None)
-                max_samples = min(len(audio_real), 5 * sr_real)
-                time_real = np.arange(max_samples) / sr_real
-                axes[0, 1].plot(time_real, audio_real[:max_samples], color='#2E8B57', linewidth=2)
-                axes[0, 1].set_title("B) Real Sound (First 5 sec)", fontsize=14, fontweight='bold')
-                axes[0, 1].set_xlabel("Time (s)")
-                axes[0, 1].set_ylabel("Amplitude")
-                axes[0, 1].grid(alpha=0.3)
-            except Exception as e:
-                print(f" Error in real waveform plot: {e}")
-
-        # --- PLOT 3: Fake Waveform ---
-        if fake_example:
-            try:
-                audio_fake, sr_fake = librosa.load(fake_example, sr=None)
-                max_samples = min(len(audio_fake), 5 * sr_fake)
-                time_fake = np.arange(max_samples) / sr_fake
-                axes[1, 0].plot(time_fake, audio_fake[:max_samples], color='#DC143C', linewidth=2)
-                axes[1, 0].set_title("C) Fake Sound (First 5 sec)", fontsize=14, fontweight='bold')
-                axes[1, 0].set_xlabel("Time (s)")
-                axes[1, 0].set_ylabel("Amplitude")
-                axes[1, 0].grid(alpha=0.3)
-            except Exception as e:
-                print(f" Error in fake waveform plot: {e}")
-
-        # --- PLOT 4: Summary ---
-        axes[1, 1].axis("off")
-        summary = "Waveform analysis complete.\n\n"
-        if real_example:
-            summary += f"Real: {os.path.basename(real_example)}\n"
-        if fake_example:
-            summary += f"Fake: {os.path.basename(fake_example)}"
-        axes[1, 1].text(0.05, 0.95, summary, transform=axes[1, 1].transAxes,
-                        fontsize=12, va='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
-
-        plt.tight_layout()
-
-        pdf_path = output_dir / "waveform_analysis.pdf"
-        plt.savefig(pdf_path, bbox_inches="tight", dpi=300)
-        plt.close(fig)
-
-        print(f" Waveform PDF saved successfully at:\n{pdf_path}")
+        reuse_figure = fig is not None
+        if not reuse_figure:
+            fig = Figure(figsize=(16, 12), constrained_layout=True)
+            axes = fig.subplots(2, 2)
+        elif axes is None:
+            # Keep fig and axes in sync when only the figure is passed
+            axes = np.array(fig.axes, dtype=object).reshape(2, 2) if fig.axes else fig.subplots(2, 2)
 
-    def create_detailed_waveform_analysis(self):
-        """Optional: Zoomed and histogram analysis"""
+        try:
+            # Select examples
+            real_example = self.real_files[0] if self.real_files else None
+            fake_example = self.fake_files[0] if self.fake_files else None
+
+            # --- PLOT 1: Combined Waveform ---
+            if real_example and fake_example:
+                try:
+                    time_real, wave_real = self._load_decimated(real_example)
+                    time_fake, wave_fake = self._load_decimated(fake_example)
+
+                    # Both waveforms go through one collection (a single draw call)
+                    colors = [to_rgba('#2E8B57', 0.8), to_rgba('#DC143C', 0.7)]
+                    waveforms = LineCollection([np.column_stack([time_real, wave_real]),
+                                                np.column_stack([time_fake, wave_fake])],
+                                               colors=colors, linewidths=1.5, rasterized=True)
+                    axes[0, 0].add_collection(waveforms)
+                    axes[0, 0].autoscale_view()
+                    handles = [Line2D([], [], color=color, linewidth=1.5) for color in colors]
+                    axes[0, 0].set_title("A) Real vs Fake Waveform", fontsize=14, fontweight='bold')
+                    axes[0, 0].set_xlabel("Time (s)")
+                    axes[0, 0].set_ylabel("Amplitude")
+                    axes[0, 0].legend(handles, ['Real Sound', 'Fake Sound'])
+                    axes[0, 0].grid(alpha=0.3)
+                    limit_ticks(axes[0, 0])
+                except Exception as e:
+                    print(f" Error plotting combined waveform: {e}")
+
+            # --- PLOT 2: Real Waveform ---
+            if real_example:
+                try:
+                    audio_real, _, time_real = self._load_prefix(real_example, 5)
+                    time_real, wave_real = decimate_waveform(audio_real, time_real)
+                    axes[0, 1].plot(time_real, wave_real, color='#2E8B57', linewidth=2, rasterized=True)
+                    axes[0, 1].set_title("B) Real Sound (First 5 sec)", fontsize=14, fontweight='bold')
+                    axes[0, 1].set_xlabel("Time (s)")
+                    axes[0, 1].set_ylabel("Amplitude")
+                    axes[0, 1].grid(alpha=0.3)
+                    limit_ticks(axes[0, 1])
+                except Exception as e:
+                    print(f" Error in real waveform plot: {e}")
+
+            # --- PLOT 3: Fake Waveform ---
+            if fake_example:
+                try:
+                    audio_fake, _, time_fake = self._load_prefix(fake_example, 5)
+                    time_fake, wave_fake = decimate_waveform(audio_fake, time_fake)
+                    axes[1, 0].plot(time_fake, wave_fake, color='#DC143C', linewidth=2, rasterized=True)
+                    axes[1, 0].set_title("C) Fake Sound (First 5 sec)", fontsize=14, fontweight='bold')
+                    axes[1, 0].set_xlabel("Time (s)")
+                    axes[1, 0].set_ylabel("Amplitude")
+                    axes[1, 0].grid(alpha=0.3)
+                    limit_ticks(axes[1, 0])
+                except Exception as e:
+                    print(f" Error in fake waveform plot: {e}")
+
+            # --- PLOT 4: Summary ---
+            axes[1, 1].axis("off")
+            summary = "Waveform analysis complete.\n\n"
+            if real_example:
+                summary += f"Real: {os.path.basename(real_example)}\n"
+            if fake_example:
+                summary += f"Fake: {os.path.basename(fake_example)}"
+            axes[1, 1].text(0.05, 0.95, summary, transform=axes[1, 1].transAxes,
+                            fontsize=12, va='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
+
+            pdf_path = output_dir / "waveform_analysis.pdf"
+            fig.savefig(pdf_path, bbox_inches="tight", dpi=150)
+            print(f" Waveform PDF saved successfully at:\n{pdf_path}")
+        finally:
+            if reuse_figure:
+                for ax in axes.flat:
+                    ax.clear()
+
+    def create_detailed_waveform_analysis(self, fig=None, axes=None):
+        """Optional: Zoomed and histogram analysis, reusing fig/axes when given"""
         if not self.real_files or not self.fake_files:
             print(" Skipping detailed analysis (need both real & fake files).")
             return
@@ -141,46 +390,71 @@ class WaveformAnalyzer:
         output_dir = Path(self.data_path) / "plots"
         output_dir.mkdir(exist_ok=True)
 
-        fig, axes = plt.subplots(3, 1, figsize=(14, 12))
+        reuse_figure = fig is not None
+        if not reuse_figure:
+            fig = Figure(figsize=(14, 12), constrained_layout=True)
+            axes = fig.subplots(3, 1)
+        elif axes is None:
+            # Keep fig and axes in sync when only the figure is passed
+            axes = np.array(fig.axes, dtype=object).reshape(3) if fig.axes else fig.subplots(3, 1)
 
         try:
-            real_audio, sr_real = librosa.load(self.real_files[0], sr=None)
-            fake_audio, sr_fake = librosa.load(self.fake_files[0], sr=None)
-
-            target_sr = min(sr_real, sr_fake, 22050)
-            if sr_real != target_sr:
-                real_audio = librosa.resample(real_audio, orig_sr=sr_real, target_sr=target_sr)
-            if sr_fake != target_sr:
-                fake_audio = librosa.resample(fake_audio, orig_sr=sr_fake, target_sr=target_sr)
+            real_example, fake_example = self.real_files[0], self.fake_files[0]
 
-            time = np.arange(len(real_audio)) / target_sr
-            axes[0].plot(time, real_audio, color='#2E8B57', label='Real', alpha=0.7)
-            axes[0].plot(time, fake_audio, color='#DC143C', label='Fake', alpha=0.7)
+            # Envelopes carry their own time axis in seconds, so no resampling is needed here
+            time_real, wave_real = self._load_decimated(real_example)
+            time_fake, wave_fake = self._load_decimated(fake_example)
+            axes[0].plot(time_real, wave_real, color='#2E8B57', label='Real', alpha=0.7, rasterized=True)
+            axes[0].plot(time_fake, wave_fake, color='#DC143C', label='Fake', alpha=0.7, rasterized=True)
             axes[0].set_title("Waveform Overlay", fontweight='bold')
             axes[0].legend()
             axes[0].grid(alpha=0.3)
+            limit_ticks(axes[0])
 
             zoom_dur = 2
-            zoom_samples = int(zoom_dur * target_sr)
-            axes[1].plot(np.arange(zoom_samples)/target_sr, real_audio[:zoom_samples], color='#2E8B57', label='Real')
-            axes[1].plot(np.arange(zoom_samples)/target_sr, fake_audio[:zoom_samples], color='#DC143C', label='Fake')
+            real_audio, sr_real, real_time = self._load_prefix(real_example, zoom_dur)
+            fake_audio, sr_fake, fake_time = self._load_prefix(fake_example, zoom_dur)
+
+            target_sr = min(sr_real, sr_fake, 22050)
+            if sr_real != target_sr:
+                g = gcd(sr_real, target_sr)
+                real_audio = resample_poly(real_audio, target_sr // g, sr_real // g)
+                real_audio = real_audio.astype(np.float32, copy=False)
+                real_time = time_axis(len(real_audio), target_sr)
+            if sr_fake != target_sr:
+                g = gcd(sr_fake, target_sr)
+                fake_audio = resample_poly(fake_audio, target_sr // g, sr_fake // g)
+                fake_audio = fake_audio.astype(np.float32, copy=False)
+                fake_time = time_axis(len(fake_audio), target_sr)
+
+            time_real, wave_real = decimate_waveform(real_audio, real_time)
+            time_fake, wave_fake = decimate_waveform(fake_audio, fake_time)
+            axes[1].plot(time_real, wave_real, color='#2E8B57', label='Real', rasterized=True)
+            axes[1].plot(time_fake, wave_fake, color='#DC143C', label='Fake', rasterized=True)
             axes[1].set_title("Zoomed (First 2 sec)", fontweight='bold')
             axes[1].legend()
             axes[1].grid(alpha=0.3)
-
-            axes[2].hist(real_audio, bins=50, alpha=0.7, density=True, label='Real', color='#2E8B57')
-            axes[2].hist(fake_audio, bins=50, alpha=0.7, density=True, label='Fake', color='#DC143C')
+            limit_ticks(axes[1])
+
+            real_hist, real_edges = self._amplitude_density(real_example, bins=50)
+            fake_hist, fake_edges = self._amplitude_density(fake_example, bins=50)
+            axes[2].bar(real_edges[:-1], real_hist, width=np.diff(real_edges), align='edge',
+                        alpha=0.7, label='Real', color='#2E8B57')
+            axes[2].bar(fake_edges[:-1], fake_hist, width=np.diff(fake_edges), align='edge',
+                        alpha=0.7, label='Fake', color='#DC143C')
             axes[2].set_title("Amplitude Distribution", fontweight='bold')
             axes[2].legend()
             axes[2].grid(alpha=0.3)
 
-            plt.tight_layout()
             pdf_path = output_dir / "detailed_waveform_analysis.pdf"
-            plt.savefig(pdf_path, bbox_inches='tight', dpi=300)
-            plt.close(fig)
+            fig.savefig(pdf_path, bbox_inches='tight', dpi=150)
             print(f" Detailed waveform PDF saved successfully at:\n{pdf_path}")
         except Exception as e:
             print(f" Error in detailed waveform analysis: {e}")
+        finally:
+            if reuse_figure:
+                for ax in axes:
+                    ax.clear()
 
 
 def main():
@@ -188,8 +462,14 @@ def main():
     analyzer = WaveformAnalyzer(DATASET_PATH)
     if not analyzer.find_audio_files():
         return
-    analyzer.create_waveform_comparison()
-    analyzer.create_detailed_waveform_analysis()
+    analyzer.prefetch_audio()
+
+    fig_main = Figure(figsize=(16, 12), constrained_layout=True)
+    fig_det = Figure(figsize=(14, 12), constrained_layout=True)
+    axes_main = fig_main.subplots(2, 2)
+    axes_det = fig_det.subplots(3, 1)
+    analyzer.create_waveform_comparison(fig_main, axes_main)
+    analyzer.create_detailed_waveform_analysis(fig_det, axes_det)
     print("\n All waveform analyses completed successfully!")
 
 